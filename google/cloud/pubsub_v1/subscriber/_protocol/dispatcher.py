@@ -15,12 +15,11 @@
 from __future__ import absolute_import
 from __future__ import division
 
-import itertools
+import concurrent.futures
 import logging
-import math
 import threading
 import typing
-from typing import List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 import warnings
 
 from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
@@ -42,9 +41,35 @@ RequestItem = Union[
     requests.NackRequest,
 ]
 
+# Module-level aliases of the request types, saving an attribute lookup on the
+# ``requests`` module whenever a batch of items is dispatched.
+_AckRequest = requests.AckRequest
+_DropRequest = requests.DropRequest
+_LeaseRequest = requests.LeaseRequest
+_ModAckRequest = requests.ModAckRequest
+_NackRequest = requests.NackRequest
+
+_StreamingPullRequestPb = gapic_types.StreamingPullRequest.pb()
+"""The raw protobuf class underlying the ``StreamingPullRequest`` wrapper class.
+
+IMPORTANT: Constructing requests from raw protobuf messages and only wrapping them
+afterwards is significantly faster than marshaling long lists of ACK IDs through
+the wrapper class.
+"""
+
+_SINGLE_TYPE_HANDLERS = {
+    _AckRequest: "ack",
+    _DropRequest: "drop",
+    _LeaseRequest: "lease",
+    _ModAckRequest: "modify_ack_deadline",
+    _NackRequest: "nack",
+}
+"""The names of the dispatcher methods handling a batch of a single request type."""
+
 
 _LOGGER = logging.getLogger(__name__)
 _CALLBACK_WORKER_NAME = "Thread-CallbackRequestDispatcher"
+_MODACK_WORKER_NAME_PREFIX = "Thread-ModAckRequestSender"
 
 
 _MAX_BATCH_SIZE = 100
@@ -74,6 +99,12 @@ class Dispatcher(object):
         self._thread: Optional[threading.Thread] = None
         self._operational_lock = threading.Lock()
 
+        # Modifying ACK deadlines only sends requests to the server, thus the modack
+        # RPCs of a batch can be sent concurrently with the batch's ACK RPCs.
+        self._modack_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=_MODACK_WORKER_NAME_PREFIX
+        )
+
     def start(self) -> None:
         """Start a thread to dispatch requests queued up by callbacks.
 
@@ -104,6 +135,7 @@ class Dispatcher(object):
                 self._thread.join()
 
             self._thread = None
+            self._modack_executor.shutdown()
 
     def dispatch_callback(self, items: Sequence[RequestItem]) -> None:
         """Map the callback request to the appropriate gRPC request.
@@ -112,42 +144,66 @@ class Dispatcher(object):
             items:
                 Queued requests to dispatch.
         """
+        _LOGGER.debug("Handling %d batched requests", len(items))
+
+        # In a steady state, batches commonly consist of a single request type
+        # only (e.g. all ACKs), which can be handed over as a whole.
+        if items:
+            item_type = type(items[0])
+            handler_name = _SINGLE_TYPE_HANDLERS.get(item_type)
+            if handler_name is not None and all(
+                type(item) is item_type for item in items
+            ):
+                getattr(self, handler_name)(items)
+                return
+
         lease_requests: List[requests.LeaseRequest] = []
         modack_requests: List[requests.ModAckRequest] = []
         ack_requests: List[requests.AckRequest] = []
         nack_requests: List[requests.NackRequest] = []
         drop_requests: List[requests.DropRequest] = []
 
+        # Request items are plain namedtuples that are never subclassed, thus
+        # bucketing them by their exact type is both correct and cheaper than a
+        # chain of isinstance() checks.
+        buckets: Dict[type, Callable[[Any], None]] = {
+            _LeaseRequest: lease_requests.append,
+            _ModAckRequest: modack_requests.append,
+            _AckRequest: ack_requests.append,
+            _NackRequest: nack_requests.append,
+            _DropRequest: drop_requests.append,
+        }
+        get_bucket = buckets.get
+
         for item in items:
-            if isinstance(item, requests.LeaseRequest):
-                lease_requests.append(item)
-            elif isinstance(item, requests.ModAckRequest):
-                modack_requests.append(item)
-            elif isinstance(item, requests.AckRequest):
-                ack_requests.append(item)
-            elif isinstance(item, requests.NackRequest):
-                nack_requests.append(item)
-            elif isinstance(item, requests.DropRequest):
-                drop_requests.append(item)
+            add_to_bucket = get_bucket(type(item))
+            if add_to_bucket is not None:
+                add_to_bucket(item)
             else:
                 warnings.warn(
                     f'Skipping unknown request item of type "{type(item)}"',
                     category=RuntimeWarning,
                 )
 
-        _LOGGER.debug("Handling %d batched requests", len(items))
+        modack_future = None
+        if modack_requests:
+            modack_future = self._modack_executor.submit(
+                self.modify_ack_deadline, modack_requests
+            )
 
         if lease_requests:
             self.lease(lease_requests)
 
-        if modack_requests:
-            self.modify_ack_deadline(modack_requests)
-
         # Note: Drop and ack *must* be after lease. It's possible to get both
         # the lease and the ack/drop request in the same batch.
         if ack_requests:
             self.ack(ack_requests)
 
+        # NACKs are modacks, too, and must not be overridden by the earlier modacks
+        # still being sent. This also re-raises any error that occurred there.
+        if modack_future is not None:
+            modack_future.result()
+
         if nack_requests:
             self.nack(nack_requests)
 
@@ -161,21 +217,23 @@ class Dispatcher(object):
             items: The items to acknowledge.
         """
         # If we got timing information, add it to the histogram.
-        for item in items:
-            time_to_ack = item.time_to_ack
-            if time_to_ack is not None:
-                self._manager.ack_histogram.add(time_to_ack)
+        times_to_ack = [
+            item.time_to_ack for item in items if item.time_to_ack is not None
+        ]
+        if times_to_ack:
+            self._manager.ack_histogram.add_many(times_to_ack)
 
         # We must potentially split the request into multiple smaller requests
         # to avoid the server-side max request size limit.
-        ack_ids = (item.ack_id for item in items)
-        total_chunks = int(math.ceil(len(items) / _ACK_IDS_BATCH_SIZE))
+        ack_ids = [item.ack_id for item in items]
+        send = self._manager.send
 
-        for _ in range(total_chunks):
-            request = gapic_types.StreamingPullRequest(
-                ack_ids=itertools.islice(ack_ids, _ACK_IDS_BATCH_SIZE)
+        for start in range(0, len(ack_ids), _ACK_IDS_BATCH_SIZE):
+            end = start + _ACK_IDS_BATCH_SIZE
+            request = gapic_types.StreamingPullRequest.wrap(
+                _StreamingPullRequestPb(ack_ids=ack_ids[start:end])
             )
-            self._manager.send(request)
+            send(request)
 
         # Remove the message from lease management.
         self.drop(items)
@@ -191,11 +249,18 @@ class Dispatcher(object):
         Args:
             items: The items to drop.
         """
-        assert self._manager.leaser is not None
-        self._manager.leaser.remove(items)
-        ordering_keys = (k.ordering_key for k in items if k.ordering_key)
-        self._manager.activate_ordering_keys(ordering_keys)
-        self._manager.maybe_resume_consumer()
+        manager = self._manager
+        leaser = manager.leaser
+        assert leaser is not None
+        leaser.remove(items)
+
+        # Most subscriptions do not use message ordering, skip the (locking)
+        # ordering keys activation altogether if there is nothing to activate.
+        if manager.ordering_enabled:
+            ordering_keys = [k.ordering_key for k in items if k.ordering_key]
+            if ordering_keys:
+                manager.activate_ordering_keys(ordering_keys)
+        manager.maybe_resume_consumer()
 
     def lease(self, items: Sequence[requests.LeaseRequest]) -> None:
         """Add the given messages to lease management.
@@ -203,9 +268,11 @@ class Dispatcher(object):
         Args:
             items: The items to lease.
         """
-        assert self._manager.leaser is not None
-        self._manager.leaser.add(items)
-        self._manager.maybe_pause_consumer()
+        manager = self._manager
+        leaser = manager.leaser
+        assert leaser is not None
+        leaser.add(items)
+        manager.maybe_pause_consumer()
 
     def modify_ack_deadline(self, items: Sequence[requests.ModAckRequest]) -> None:
         """Modify the ack deadline for the given messages.
@@ -213,18 +280,9 @@ class Dispatcher(object):
         Args:
             items: The items to modify.
         """
-        # We must potentially split the request into multiple smaller requests
-        # to avoid the server-side max request size limit.
-        ack_ids = (item.ack_id for item in items)
-        seconds = (item.seconds for item in items)
-        total_chunks = int(math.ceil(len(items) / _ACK_IDS_BATCH_SIZE))
-
-        for _ in range(total_chunks):
-            request = gapic_types.StreamingPullRequest(
-                modify_deadline_ack_ids=itertools.islice(ack_ids, _ACK_IDS_BATCH_SIZE),
-                modify_deadline_seconds=itertools.islice(seconds, _ACK_IDS_BATCH_SIZE),
-            )
-            self._manager.send(request)
+        self._send_modack(
+            [item.ack_id for item in items], [item.seconds for item in items]
+        )
 
     def nack(self, items: Sequence[requests.NackRequest]) -> None:
         """Explicitly deny receipt of messages.
@@ -232,7 +290,30 @@ class Dispatcher(object):
         Args:
             items: The items to deny.
         """
-        self.modify_ack_deadline(
-            [requests.ModAckRequest(ack_id=item.ack_id, seconds=0) for item in items]
-        )
-        self.drop([requests.DropRequest(*item) for item in items])
+        # Send the modacks directly instead of converting the items to
+        # ModAckRequest instances first, the ACK deadline is always zero.
+        self._send_modack([item.ack_id for item in items], [0] * len(items))
+
+        # NackRequest items carry all the information needed to drop them.
+        self.drop(items)
+
+    def _send_modack(self, ack_ids: List[str], seconds: List[float]) -> None:
+        """Send requests modifying the ACK deadlines of the given ACK IDs.
+
+        Args:
+            ack_ids: The ACK IDs to modify the deadline of.
+            seconds: The new ACK deadlines, one for each of the ``ack_ids``.
+        """
+        # We must potentially split the request into multiple smaller requests
+        # to avoid the server-side max request size limit.
+        send = self._manager.send
+
+        for start in range(0, len(ack_ids), _ACK_IDS_BATCH_SIZE):
+            end = start + _ACK_IDS_BATCH_SIZE
+            request = gapic_types.StreamingPullRequest.wrap(
+                _StreamingPullRequestPb(
+                    modify_deadline_ack_ids=ack_ids[start:end],
+                    modify_deadline_seconds=seconds[start:end],
+                )
+            )
+            send(request)
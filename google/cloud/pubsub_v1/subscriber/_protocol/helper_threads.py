@@ -14,12 +14,13 @@
 
 import logging
 import queue
+import threading
 import time
-from typing import Any, Callable, List, Sequence
+from typing import Any, Callable, Iterable, List, Optional, Sequence
 import uuid
 
 
-__all__ = ("QueueCallbackWorker", "STOP")
+__all__ = ("MPSCQueue", "QueueCallbackWorker", "STOP")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +32,84 @@ _LOGGER = logging.getLogger(__name__)
 STOP = uuid.uuid4()
 
 
+class MPSCQueue(queue.Queue):
+    """An unbounded multi-producer, single-consumer queue.
+
+    A drop-in replacement for :class:`queue.Queue` for the case when many
+    threads put items into the queue, but only a single thread takes them out,
+    e.g. the message callbacks sending requests to the dispatcher thread.
+
+    Putting an item is a plain (thread-safe) ``deque.append()`` without
+    acquiring any locks, and the consumer is only woken up if it is actually
+    waiting for new items. Only :meth:`put`, :meth:`put_many` and :meth:`get`
+    (and their ``_nowait`` variants) are supported, the ``task_done()`` and
+    ``join()`` bookkeeping is not.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._consumer_waiting = False
+        self._item_available = threading.Event()
+
+    def put(
+        self, item: Any, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Put an item into the queue. Never blocks, as the queue is unbounded."""
+        self.queue.append(item)
+        if self._consumer_waiting:
+            self._item_available.set()
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Put multiple items into the queue at once. Never blocks."""
+        self.queue.extend(items)
+        if self._consumer_waiting:
+            self._item_available.set()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return an item from the queue.
+
+        Must only be called from a single (consumer) thread at a time.
+
+        Args:
+            block:
+                Whether to wait for an item if the queue is empty.
+            timeout:
+                The maximum number of seconds to wait for an item. If ``None``,
+                wait until an item becomes available.
+
+        Raises:
+            queue.Empty: If no item is available (in time).
+        """
+        try:
+            return self.queue.popleft()
+        except IndexError:
+            if not block:
+                raise queue.Empty from None
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                # Announce waiting *before* re-checking the queue, so that an
+                # item put in the meantime either gets popped here or sets the
+                # event we are about to wait on.
+                self._consumer_waiting = True
+                self._item_available.clear()
+                try:
+                    return self.queue.popleft()
+                except IndexError:
+                    pass
+
+                if deadline is None:
+                    self._item_available.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Empty
+                    self._item_available.wait(remaining)
+        finally:
+            self._consumer_waiting = False
+
+
 def _get_many(
     queue_: queue.Queue, max_items: int = None, max_latency: float = 0
 ) -> List[Any]:
@@ -55,9 +134,19 @@ def _get_many(
     # Always return at least one item.
     items = [queue_.get()]
     while max_items is None or len(items) < max_items:
+        # Drain the items that are already available first, only wait for more
+        # (with a timeout) once the queue has been emptied.
+        try:
+            items.append(queue_.get_nowait())
+            continue
+        except queue.Empty:
+            pass
+
+        timeout = max_latency - (time.time() - start)
+        if timeout <= 0:
+            break
+
         try:
-            elapsed = time.time() - start
-            timeout = max(0, max_latency - elapsed)
             items.append(queue_.get(timeout=timeout))
         except queue.Empty:
             break
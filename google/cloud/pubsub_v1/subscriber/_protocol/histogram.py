@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Optional, Union
 
 
 MIN_ACK_DEADLINE = 10
@@ -117,18 +117,58 @@ class Histogram(object):
                 will be raised to ``MIN_ACK_DEADLINE`` or reduced to
                 ``MAX_ACK_DEADLINE``.
         """
-        # If the value is out of bounds, bring it in bounds.
-        value = int(value)
-        if value < MIN_ACK_DEADLINE:
-            value = MIN_ACK_DEADLINE
-        elif value > MAX_ACK_DEADLINE:
-            value = MAX_ACK_DEADLINE
+        value = self._clamp(value)
 
         # Add the value to the histogram's data dictionary.
         self._data.setdefault(value, 0)
         self._data[value] += 1
         self._len += 1
 
+    def add_many(self, values: Iterable[Union[int, float]]) -> None:
+        """Add multiple values to this histogram.
+
+        This is equivalent to calling :meth:`add` for each of the values, but
+        avoids the method call overhead per value.
+
+        Args:
+            values:
+                The values. Values outside of
+                ``MIN_ACK_DEADLINE <= x <= MAX_ACK_DEADLINE``
+                will be raised to ``MIN_ACK_DEADLINE`` or reduced to
+                ``MAX_ACK_DEADLINE``.
+        """
+        data = self._data
+        clamp = self._clamp
+        count = 0
+
+        for value in values:
+            value = clamp(value)
+
+            # Add the value to the histogram's data dictionary.
+            data.setdefault(value, 0)
+            data[value] += 1
+            count += 1
+
+        self._len += count
+
+    @staticmethod
+    def _clamp(value: Union[int, float]) -> int:
+        """Convert the value to an integer within the valid ACK deadline bounds.
+
+        Args:
+            value: The value to convert.
+
+        Returns:
+            The value, raised to ``MIN_ACK_DEADLINE`` or reduced to
+            ``MAX_ACK_DEADLINE`` if it is out of bounds.
+        """
+        value = int(value)
+        if value < MIN_ACK_DEADLINE:
+            return MIN_ACK_DEADLINE
+        if value > MAX_ACK_DEADLINE:
+            return MAX_ACK_DEADLINE
+        return value
+
     def percentile(self, percent: Union[int, float]) -> int:
         """Return the value that is the Nth precentile in the histogram.
 
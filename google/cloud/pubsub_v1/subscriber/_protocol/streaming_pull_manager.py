@@ -189,6 +189,10 @@ class StreamingPullManager(object):
         # currently on hold.
         self._pause_resume_lock = threading.Lock()
 
+        # Whether any of the received messages had an ordering key. If not, there
+        # are no ordering keys to activate when messages get dropped.
+        self._ordering_enabled = False
+
         # A lock protecting the current ACK deadline used in the lease management. This
         # value can be potentially updated both by the leaser thread and by the message
         # consumer thread when invoking the internal _on_response() callback.
@@ -224,6 +228,11 @@ class StreamingPullManager(object):
         """The leaser helper."""
         return self._leaser
 
+    @property
+    def ordering_enabled(self) -> bool:
+        """``True`` if any of the messages received so far had an ordering key."""
+        return self._ordering_enabled
+
     @property
     def ack_histogram(self) -> histogram.Histogram:
         """The histogram tracking time-to-acknowledge."""
@@ -751,6 +760,8 @@ class StreamingPullManager(object):
                     received_message.delivery_attempt,
                     self._scheduler.queue,
                 )
+                if message.ordering_key:
+                    self._ordering_enabled = True
                 self._messages_on_hold.put(message)
                 self._on_hold_bytes += message.size
                 req = requests.LeaseRequest(
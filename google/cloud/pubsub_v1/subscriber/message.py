@@ -19,7 +19,7 @@ import json
 import math
 import time
 import typing
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
@@ -30,6 +30,12 @@ if typing.TYPE_CHECKING:  # pragma: NO COVER
     from google.protobuf.internal import containers
 
 
+# Bind the functions used for every received / acknowledged message locally, which
+# saves a module attribute lookup on each call.
+_time_time = time.time
+_math_ceil = math.ceil
+
+
 _MESSAGE_REPR = """\
 Message {{
   data: {!r}
@@ -120,19 +126,23 @@ class Message(object):
         # The instantiation time is the time that this message
         # was received. Tracking this provides us a way to be smart about
         # the default lease deadline.
-        self._received_timestamp = time.time()
+        self._received_timestamp = _time_time()
 
         # Store the message attributes directly to speed up attribute access, i.e.
         # to avoid two lookups if self._message.<attribute> pattern was used in
         # properties.
         self._attributes = message.attributes
         self._data = message.data
-        self._publish_time = dt.datetime.fromtimestamp(
-            message.publish_time.seconds + message.publish_time.nanos / 1e9,
-            tz=dt.timezone.utc,
-        )
+
+        # Converting the publish time to a datetime is relatively expensive and
+        # many users never look at it, thus it is only done on first access.
+        self._publish_time: Optional["datetime.datetime"] = None
+
         self._ordering_key = message.ordering_key
-        self._size = message.ByteSize()
+
+        # Computing the size requires walking the entire message, thus it is only
+        # done when actually needed.
+        self._size: Optional[int] = None
 
     def __repr__(self):
         # Get an abbreviated version of the data.
@@ -184,6 +194,11 @@ class Message(object):
         Returns:
             The date and time that the message was published.
         """
+        if self._publish_time is None:
+            publish_time = self._message.publish_time
+            self._publish_time = dt.datetime.fromtimestamp(
+                publish_time.seconds + publish_time.nanos / 1e9, tz=dt.timezone.utc,
+            )
         return self._publish_time
 
     @property
@@ -194,6 +209,8 @@ class Message(object):
     @property
     def size(self) -> int:
         """Return the size of the underlying message, in bytes."""
+        if self._size is None:
+            self._size = self._message.ByteSize()
         return self._size
 
     @property
@@ -235,16 +252,57 @@ class Message(object):
             ensure that your processing code is idempotent, as you may
             receive any given message more than once.
         """
-        time_to_ack = math.ceil(time.time() - self._received_timestamp)
+        time_to_ack = _math_ceil(_time_time() - self._received_timestamp)
         self._request_queue.put(
             requests.AckRequest(
                 ack_id=self._ack_id,
                 byte_size=self.size,
                 time_to_ack=time_to_ack,
-                ordering_key=self.ordering_key,
+                ordering_key=self._ordering_key,
             )
         )
 
+    @staticmethod
+    def ack_many(messages: Sequence["Message"]) -> None:
+        """Acknowledge the given messages.
+
+        This is equivalent to calling :meth:`ack` on each of the messages, but
+        sends all the acknowledgements to the policy at once, which is cheaper
+        when acknowledging many messages at the same time.
+
+        .. warning::
+            Acks in Pub/Sub are best effort. You should always
+            ensure that your processing code is idempotent, as you may
+            receive any given message more than once.
+
+        Args:
+            messages: The messages to acknowledge.
+        """
+        now = _time_time()
+        ack_requests: Dict["queue.Queue", List[requests.AckRequest]] = {}
+
+        # The messages might have been received by different subscribers, thus
+        # group the requests by the queue they need to be put into.
+        for message in messages:
+            ack_requests.setdefault(message._request_queue, []).append(
+                requests.AckRequest(
+                    ack_id=message._ack_id,
+                    byte_size=message.size,
+                    time_to_ack=_math_ceil(now - message._received_timestamp),
+                    ordering_key=message._ordering_key,
+                )
+            )
+
+        # Use a single bulk put if the queue supports it (e.g. the queue of the
+        # default scheduler), and fall back to putting the requests one by one.
+        for request_queue, queue_requests in ack_requests.items():
+            put_many = getattr(request_queue, "put_many", None)
+            if put_many is not None:
+                put_many(queue_requests)
+            else:
+                for request in queue_requests:
+                    request_queue.put(request)
+
     def drop(self) -> None:
         """Release the message from lease management.
 
@@ -260,7 +318,9 @@ class Message(object):
         """
         self._request_queue.put(
             requests.DropRequest(
-                ack_id=self._ack_id, byte_size=self.size, ordering_key=self.ordering_key
+                ack_id=self._ack_id,
+                byte_size=self.size,
+                ordering_key=self._ordering_key,
             )
         )
 
@@ -291,6 +351,8 @@ class Message(object):
         """
         self._request_queue.put(
             requests.NackRequest(
-                ack_id=self._ack_id, byte_size=self.size, ordering_key=self.ordering_key
+                ack_id=self._ack_id,
+                byte_size=self.size,
+                ordering_key=self._ordering_key,
             )
         )
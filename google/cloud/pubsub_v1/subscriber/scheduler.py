@@ -25,6 +25,8 @@ import typing
 from typing import Callable, List, Optional
 import warnings
 
+from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
+
 if typing.TYPE_CHECKING:  # pragma: NO COVER
     from google.cloud import pubsub_v1
 
@@ -101,7 +103,7 @@ class ThreadScheduler(Scheduler):
     def __init__(
         self, executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
     ):
-        self._queue: queue.Queue = queue.Queue()
+        self._queue: queue.Queue = helper_threads.MPSCQueue()
         if executor is None:
             self._executor = _make_default_thread_pool_executor()
         else:
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import collections
+import concurrent.futures
 import queue
 import threading
 import warnings
@@ -76,6 +77,79 @@ def test_dispatch_callback_inactive_manager(item, method_name):
     method.assert_called_once_with([item])
 
 
+def test_dispatch_callback_mixed_request_types():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    items = [
+        requests.AckRequest("0", 0, 0, ""),
+        requests.ModAckRequest("1", 0),
+        requests.AckRequest("2", 0, 0, ""),
+    ]
+
+    with mock.patch.multiple(
+        dispatcher_, ack=mock.DEFAULT, modify_ack_deadline=mock.DEFAULT
+    ) as methods:
+        dispatcher_.dispatch_callback(items)
+
+    methods["ack"].assert_called_once_with([items[0], items[2]])
+    methods["modify_ack_deadline"].assert_called_once_with([items[1]])
+
+
+def test_dispatch_callback_modacks_sent_before_nacks():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+    handled = []
+    ack_done = threading.Event()
+
+    def fake_ack(items):
+        handled.append("ack")
+        ack_done.set()
+
+    def fake_modify_ack_deadline(items):
+        # Only finish sending the modacks once the ACKs have been sent, which
+        # must not deadlock. The error is re-raised by dispatch_callback().
+        assert ack_done.wait(timeout=5), "ACKs were not sent concurrently"
+        handled.append("modack")
+
+    items = [
+        requests.ModAckRequest("0", 60),
+        requests.NackRequest("0", 0, ""),
+        requests.AckRequest("1", 0, 0, ""),
+    ]
+
+    with mock.patch.multiple(
+        dispatcher_,
+        modify_ack_deadline=mock.Mock(side_effect=fake_modify_ack_deadline),
+        ack=mock.Mock(side_effect=fake_ack),
+        nack=mock.Mock(side_effect=lambda items: handled.append("nack")),
+    ):
+        dispatcher_.dispatch_callback(items)
+
+    # The ACK does not need to wait for the modacks to be sent, but the NACK does.
+    assert handled == ["ack", "modack", "nack"]
+
+
+def test_dispatch_callback_modack_error():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    items = [requests.ModAckRequest("0", 60), requests.AckRequest("1", 0, 0, "")]
+    error = RuntimeError("send failed")
+
+    with mock.patch.multiple(
+        dispatcher_, modify_ack_deadline=mock.Mock(side_effect=error), ack=mock.DEFAULT
+    ):
+        with pytest.raises(RuntimeError, match="send failed"):
+            dispatcher_.dispatch_callback(items)
+
+
 def test_dispatch_callback_inactive_manager_unknown_request():
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True
@@ -115,7 +189,7 @@ def test_ack():
 
     manager.leaser.remove.assert_called_once_with(items)
     manager.maybe_resume_consumer.assert_called_once()
-    manager.ack_histogram.add.assert_called_once_with(20)
+    manager.ack_histogram.add_many.assert_called_once_with([20])
 
 
 def test_ack_no_time():
@@ -135,7 +209,7 @@ def test_ack_no_time():
         gapic_types.StreamingPullRequest(ack_ids=["ack_id_string"])
     )
 
-    manager.ack_histogram.add.assert_not_called()
+    manager.ack_histogram.add_many.assert_not_called()
 
 
 def test_ack_splitting_large_payload():
@@ -195,7 +269,7 @@ def test_drop_unordered_messages():
     dispatcher_.drop(items)
 
     manager.leaser.remove.assert_called_once_with(items)
-    assert list(manager.activate_ordering_keys.call_args.args[0]) == []
+    manager.activate_ordering_keys.assert_not_called()
     manager.maybe_resume_consumer.assert_called_once()
 
 
@@ -217,6 +291,23 @@ def test_drop_ordered_messages():
     manager.maybe_resume_consumer.assert_called_once()
 
 
+def test_drop_ordering_disabled():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    manager.ordering_enabled = False
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    items = [
+        requests.DropRequest(ack_id="ack_id_string", byte_size=10, ordering_key="")
+    ]
+    dispatcher_.drop(items)
+
+    manager.leaser.remove.assert_called_once_with(items)
+    manager.activate_ordering_keys.assert_not_called()
+    manager.maybe_resume_consumer.assert_called_once()
+
+
 def test_nack():
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True
@@ -234,6 +325,38 @@ def test_nack():
         )
     )
 
+    manager.leaser.remove.assert_called_once_with(items)
+    manager.maybe_resume_consumer.assert_called_once()
+
+
+def test_nack_splitting_large_payload():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    items = [
+        # use realistic lengths for ACK IDs (max 176 bytes)
+        requests.NackRequest(ack_id=str(i).zfill(176), byte_size=0, ordering_key="")
+        for i in range(5001)
+    ]
+    dispatcher_.nack(items)
+
+    calls = manager.send.call_args_list
+    assert len(calls) == 3
+
+    all_ack_ids = {item.ack_id for item in items}
+    sent_ack_ids = collections.Counter()
+
+    for call in calls:
+        message = call.args[0]
+        assert message._pb.ByteSize() <= 524288  # server-side limit (2**19)
+        assert set(message.modify_deadline_seconds) == {0}
+        sent_ack_ids.update(message.modify_deadline_ack_ids)
+
+    assert set(sent_ack_ids) == all_ack_ids  # all messages should have been NACK-ed
+    assert sent_ack_ids.most_common(1)[0][1] == 1  # each message NACK-ed exactly once
+
 
 def test_modify_ack_deadline():
     manager = mock.create_autospec(
@@ -316,12 +439,17 @@ def test_stop():
     dispatcher_ = dispatcher.Dispatcher(mock.sentinel.manager, queue_)
     thread = mock.create_autospec(threading.Thread, instance=True)
     dispatcher_._thread = thread
+    modack_executor = mock.create_autospec(
+        concurrent.futures.ThreadPoolExecutor, instance=True
+    )
+    dispatcher_._modack_executor = modack_executor
 
     dispatcher_.stop()
 
     assert queue_.get() is helper_threads.STOP
     thread.join.assert_called_once()
     assert dispatcher_._thread is None
+    modack_executor.shutdown.assert_called_once()
 
 
 def test_stop_no_join():
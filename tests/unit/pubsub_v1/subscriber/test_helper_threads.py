@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import mock
+import pytest
 import queue
+import threading
 
 from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 
@@ -116,3 +118,75 @@ def test_queue_callback_worker_exception():
         # Assert that we got the expected calls.
         assert get.call_count == 3
         callback.assert_called_once_with([mock.sentinel.A])
+
+
+def test_queue_callback_worker_drains_available_items():
+    queue_ = queue.Queue()
+    callback = mock.Mock(spec=())
+    qct = helper_threads.QueueCallbackWorker(
+        queue_, callback, max_items=3, max_latency=10
+    )
+
+    # Set up an appropriate mock for the queue, and call the queue callback
+    # thread.
+    with mock.patch.object(queue.Queue, "get") as get:
+        get.side_effect = (
+            mock.sentinel.A,
+            mock.sentinel.B,
+            helper_threads.STOP,
+        )
+        qct()
+
+        # Items already in the queue must be drained without waiting.
+        assert get.call_count == 3
+        assert get.call_args_list[1:] == [mock.call(block=False)] * 2
+        callback.assert_called_once_with([mock.sentinel.A, mock.sentinel.B])
+
+
+def test_mpsc_queue_put_get():
+    queue_ = helper_threads.MPSCQueue()
+
+    queue_.put(mock.sentinel.A)
+    queue_.put_nowait(mock.sentinel.B)
+
+    assert queue_.qsize() == 2
+    assert queue_.get() is mock.sentinel.A
+    assert queue_.get_nowait() is mock.sentinel.B
+    assert queue_.empty()
+
+
+def test_mpsc_queue_put_many():
+    queue_ = helper_threads.MPSCQueue()
+
+    queue_.put_many([mock.sentinel.A, mock.sentinel.B])
+
+    assert queue_.get() is mock.sentinel.A
+    assert queue_.get() is mock.sentinel.B
+    assert queue_.empty()
+
+
+def test_mpsc_queue_get_nowait_empty():
+    queue_ = helper_threads.MPSCQueue()
+
+    with pytest.raises(queue.Empty):
+        queue_.get_nowait()
+
+
+def test_mpsc_queue_get_timeout():
+    queue_ = helper_threads.MPSCQueue()
+
+    with pytest.raises(queue.Empty):
+        queue_.get(timeout=0.01)
+
+    assert not queue_._consumer_waiting
+
+
+def test_mpsc_queue_get_wakes_up_on_put():
+    queue_ = helper_threads.MPSCQueue()
+    producer = threading.Timer(0.05, queue_.put, args=(mock.sentinel.A,))
+    producer.start()
+
+    try:
+        assert queue_.get(timeout=10) is mock.sentinel.A
+    finally:
+        producer.join()
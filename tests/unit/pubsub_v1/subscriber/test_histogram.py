@@ -77,6 +77,18 @@ def test_add_upper_limit():
     assert histogram.MAX_ACK_DEADLINE in histo
 
 
+def test_add_many():
+    histo = histogram.Histogram()
+    histo.add_many([60, 60.4, histogram.MIN_ACK_DEADLINE - 1])
+    assert histo._data[60] == 2
+    assert histo._data[histogram.MIN_ACK_DEADLINE] == 1
+    assert len(histo) == 3
+
+    histo.add_many([histogram.MAX_ACK_DEADLINE + 1])
+    assert histo._data[histogram.MAX_ACK_DEADLINE] == 1
+    assert len(histo) == 4
+
+
 def test_percentile():
     histo = histogram.Histogram()
     assert histo.percentile(42) == histogram.MIN_ACK_DEADLINE  # default when empty
@@ -14,12 +14,13 @@
 
 import datetime
 import queue
-import time
+import weakref
 
 import mock
 
 from google.api_core import datetime_helpers
 from google.cloud.pubsub_v1.subscriber import message
+from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 from google.protobuf import timestamp_pb2
 from google.pubsub_v1 import types as gapic_types
@@ -32,8 +33,15 @@ PUBLISHED = RECEIVED + datetime.timedelta(days=1, microseconds=PUBLISHED_MICROS)
 PUBLISHED_SECONDS = datetime_helpers.to_milliseconds(PUBLISHED) // 1000
 
 
-def create_message(data, ack_id="ACKID", delivery_attempt=0, ordering_key="", **attrs):
-    with mock.patch.object(time, "time") as time_:
+def create_message(
+    data,
+    ack_id="ACKID",
+    delivery_attempt=0,
+    ordering_key="",
+    request_queue=None,
+    **attrs
+):
+    with mock.patch.object(message, "_time_time") as time_:
         time_.return_value = RECEIVED_SECONDS
         gapic_pubsub_message = gapic_types.PubsubMessage(
             attributes=attrs,
@@ -50,11 +58,20 @@ def create_message(data, ack_id="ACKID", delivery_attempt=0, ordering_key="", **
             message=gapic_pubsub_message._pb,
             ack_id=ack_id,
             delivery_attempt=delivery_attempt,
-            request_queue=queue.Queue(),
+            request_queue=queue.Queue() if request_queue is None else request_queue,
         )
         return msg
 
 
+def test_instance_patchable():
+    # Users commonly patch message methods when testing their callbacks.
+    msg = create_message(b"foo")
+    with mock.patch.object(msg, "ack") as ack:
+        msg.ack()
+    ack.assert_called_once()
+    assert weakref.ref(msg)() is msg
+
+
 def test_attributes():
     msg = create_message(b"foo", baz="bacon", spam="eggs")
     assert msg.attributes == {"baz": "bacon", "spam": "eggs"}
@@ -132,6 +149,82 @@ def test_ack():
         check_call_types(put, requests.AckRequest)
 
 
+def test_ack_time_to_ack():
+    msg = create_message(b"foo", ack_id="bogus_ack_id")
+    with mock.patch.object(msg._request_queue, "put") as put:
+        with mock.patch.object(message, "_time_time") as time_:
+            time_.return_value = RECEIVED_SECONDS + 12.3
+            msg.ack()
+        put.assert_called_once_with(
+            requests.AckRequest(
+                ack_id="bogus_ack_id", byte_size=30, time_to_ack=13, ordering_key="",
+            )
+        )
+
+
+def test_ack_many():
+    queue_ = queue.Queue()
+    msg1 = create_message(b"foo", ack_id="ack_id_1", request_queue=queue_)
+    msg2 = create_message(b"bar", ack_id="ack_id_2", request_queue=queue_)
+    with mock.patch.object(queue_, "put") as put:
+        message.Message.ack_many([msg1, msg2])
+        put.assert_has_calls(
+            [
+                mock.call(
+                    requests.AckRequest(
+                        ack_id="ack_id_1",
+                        byte_size=30,
+                        time_to_ack=mock.ANY,
+                        ordering_key="",
+                    )
+                ),
+                mock.call(
+                    requests.AckRequest(
+                        ack_id="ack_id_2",
+                        byte_size=30,
+                        time_to_ack=mock.ANY,
+                        ordering_key="",
+                    )
+                ),
+            ]
+        )
+        assert put.call_count == 2
+
+
+def test_ack_many_single_put():
+    queue_ = helper_threads.MPSCQueue()
+    other_queue = helper_threads.MPSCQueue()
+    msg1 = create_message(b"foo", ack_id="ack_id_1", request_queue=queue_)
+    msg2 = create_message(b"bar", ack_id="ack_id_2", request_queue=other_queue)
+    msg3 = create_message(b"baz", ack_id="ack_id_3", request_queue=queue_)
+
+    with mock.patch.object(queue_, "put") as put:
+        message.Message.ack_many([msg1, msg2, msg3])
+
+    put.assert_not_called()
+    assert [request.ack_id for request in queue_.queue] == ["ack_id_1", "ack_id_3"]
+    assert [request.ack_id for request in other_queue.queue] == ["ack_id_2"]
+
+
+def test_ack_many_custom_queue_with_put_many():
+    class BulkQueue(queue.Queue):
+        def put_many(self, items):
+            for item in items:
+                self.put(item)
+
+    queue_ = BulkQueue()
+    msg1 = create_message(b"foo", ack_id="ack_id_1", request_queue=queue_)
+    msg2 = create_message(b"bar", ack_id="ack_id_2", request_queue=queue_)
+
+    with mock.patch.object(queue_, "put_many") as put_many:
+        message.Message.ack_many([msg1, msg2])
+
+    put_many.assert_called_once()
+    sent_requests = put_many.call_args.args[0]
+    assert [request.ack_id for request in sent_requests] == ["ack_id_1", "ack_id_2"]
+    assert all(isinstance(request, requests.AckRequest) for request in sent_requests)
+
+
 def test_drop():
     msg = create_message(b"foo", ack_id="bogus_ack_id")
     with mock.patch.object(msg._request_queue, "put") as put:
@@ -902,6 +902,9 @@ def test__on_response_no_leaser_overload():
     # the leaser load limit not hit, no messages had to be put on hold
     assert manager._messages_on_hold.size == 0
 
+    # none of the messages had an ordering key
+    assert not manager.ordering_enabled
+
 
 def test__on_response_with_leaser_overload():
     manager, _, dispatcher, leaser, _, scheduler = make_running_manager()
@@ -1038,6 +1041,9 @@ def test__on_response_with_ordering_keys():
     assert isinstance(call_args[1], message.Message)
     assert call_args[1].message_id == "2"
 
+    # A message with an ordering key has been received.
+    assert manager.ordering_enabled
+
     # Message 3 should have been put on hold.
     assert manager._messages_on_hold.size == 1
     # No messages available because message 2 (with "key1") has not completed yet.